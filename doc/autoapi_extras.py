@@ -0,0 +1,56 @@
+"""Sphinx extension to make the ``autoapi*`` directives behave like autodoc.
+
+The autodoc-style directives of sphinx-autoapi find members through static
+analysis. This extension
+
+- skips the members that autodoc would skip as well, i.e., members that are
+  not listed in the ``__all__`` of a module, or members that are imported
+  into a module without ``__all__``;
+- provides the ``autoapimodulesummary`` directive, which renders an
+  ``autoapisummary`` table of all public members of the module given as
+  argument, similar to the tables that were created by ``autodocsumm``.
+"""
+from autoapi._objects import PythonObject
+from autoapi.directives import AutoapiSummary
+from docutils.statemachine import StringList
+
+
+def _is_hidden(obj):
+    """Check if sphinx-autoapi marked an object as hidden."""
+    return obj.obj.get('hide', False)
+
+
+class AutoapiModuleSummary(AutoapiSummary):
+    """Summary table of the public members of a module."""
+
+    required_arguments = 1
+    has_content = False
+
+    def run(self):
+        """Fill the summary table with the members of the module."""
+        env = self.state.document.settings.env
+        module = env.autoapi_all_objects[self.arguments[0]]
+        names = [
+            child.id for child in module.children
+            if not _is_hidden(child) and not child.is_private_member
+        ]
+        self.content = StringList(names)
+        return super().run()
+
+
+def skip_hidden_member(app, what, name, obj, skip, options):
+    """Skip members that are hidden by ``__all__`` or imported."""
+    if isinstance(obj, PythonObject) and _is_hidden(obj):
+        return True
+    return None
+
+
+def setup(app):
+    """Set up the extension."""
+    app.setup_extension('autoapi.extension')
+    app.add_directive('autoapimodulesummary', AutoapiModuleSummary)
+    app.connect('autodoc-skip-member', skip_hidden_member)
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
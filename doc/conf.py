@@ -15,15 +15,27 @@
 import os
 import sys
 from datetime import datetime
+from importlib.metadata import version as _get_version
 from pathlib import Path
 
+from packaging.version import Version
+
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 root = Path(__file__).absolute().parent.parent
 sys.path.insert(0, str(root))
+sys.path.append(os.path.dirname(__file__))
+
+from intersphinx_inventories import (
+    INVENTORY_DIR,
+    get_intersphinx_urls,
+    get_rtd_version,
+)
 
-from esmvalcore import __version__
+# Read the version from the package metadata instead of importing esmvalcore,
+# this keeps the documentation build free of heavy runtime imports.
+__version__ = _get_version('ESMValCore')
 
 # -- RTD configuration ------------------------------------------------
 
@@ -44,8 +56,7 @@ if on_rtd:
     os.environ["ESMFMKFILE"] = f"{rtd_conda_prefix}/lib/esmf.mk"
     os.environ["PROJ_DATA"] = f"{rtd_conda_prefix}/share/proj"
     os.environ["PROJ_NETWORK"] = "OFF"
-if rtd_version not in ["latest", "stable", "doc"]:
-    rtd_version = "latest"
+rtd_version = get_rtd_version(rtd_version)
 
 # -- General configuration ------------------------------------------------
 
@@ -56,9 +67,9 @@ if rtd_version not in ["latest", "stable", "doc"]:
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'autodocsumm',
+    'autoapi.extension',
+    'autoapi_extras',
     'nbsphinx',
-    'sphinx.ext.autodoc',
     'sphinx.ext.doctest',
     'sphinx.ext.extlinks',
     'sphinx.ext.intersphinx',
@@ -70,17 +81,33 @@ extensions = [
     'sphinx.ext.napoleon',
 ]
 
+# Configuration for sphinx-autoapi, which collects the API documentation by
+# statically parsing the source code instead of importing it. The API
+# reference pages in doc/api are written by hand using the autodoc-style
+# ``autoapi*`` directives, so the automatic page generation is disabled.
+# The summary tables of module members on these pages are added with the
+# ``autoapimodulesummary`` directive from doc/autoapi_extras.py.
+autoapi_dirs = [str(root / 'esmvalcore')]
+autoapi_generate_api_docs = False
+# Do not warn about imports of standard library objects that cannot be
+# resolved by the static analysis.
+suppress_warnings = ['autoapi.python_import_resolution']
+
+# Default options for the autodoc-style ``autoapi*`` directives
 autodoc_default_options = {
     'members': True,
     'undoc-members': True,
     'inherited-members': True,
     'show-inheritance': True,
-    'autosummary': True,
 }
 
 # Show type hints in function signature AND docstring
 autodoc_typehints = 'both'
 
+# Render the 'Attributes' section of docstrings as a field list, the
+# attributes themselves are already documented by sphinx-autoapi
+napoleon_use_ivar = True
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -101,10 +128,13 @@ copyright = u'{0}, ESMValTool Development Team'.format(datetime.now().year)
 # |version| and |release|, also used in various other places throughout the
 # built documents.
 #
+# The full version, without the development and local version suffixes.
+# Sphinx stores these values in its environment pickle, so including the
+# commit hash of development versions would invalidate the cache of previously
+# built pages on every commit.
+release = Version(__version__).base_version
 # The short X.Y version.
-version = '.'.join(__version__.split('.')[0:1])
-# The full version, including alpha/beta/rc tags.
-release = __version__
+version = '.'.join(release.split('.')[:2])
 
 # The language for content autogenerated by Sphinx. Refer to documentation
 # for a list of supported languages.
@@ -429,26 +459,22 @@ epub_exclude_files = ['search.html']
 # If false, no index is generated.
 # epub_use_index = True
 
-numfig = True
+# Do not number figures, tables and code blocks. With numbering enabled, Sphinx
+# recomputes the numbers for the whole project whenever a page changes and
+# rewrites all pages whose numbers changed, which defeats incremental builds.
+# The documentation does not refer to any of these by number (``:numref:``),
+# so the only effect is that captions are shown without a number.
+numfig = False
 
 # Configuration for intersphinx
+# Inventories downloaded by running ``python doc/fetch_intersphinx.py`` are
+# stored in INVENTORY_DIR. They are tried before the remote inventories, so
+# a slow or unavailable network connection does not slow down or break the
+# build. Note that local inventories are never updated automatically; rerun
+# the script to refresh them.
 intersphinx_mapping = {
-    'cf_units': ('https://cf-units.readthedocs.io/en/latest/', None),
-    'cftime': ('https://unidata.github.io/cftime/', None),
-    'esmvalcore':
-    (f'https://docs.esmvaltool.org/projects/ESMValCore/en/{rtd_version}/',
-     None),
-    'esmvaltool': (f'https://docs.esmvaltool.org/en/{rtd_version}/', None),
-    'dask': ('https://docs.dask.org/en/stable/', None),
-    'distributed': ('https://distributed.dask.org/en/stable/', None),
-    'iris': ('https://scitools-iris.readthedocs.io/en/latest/', None),
-    'iris-esmf-regrid': ('https://iris-esmf-regrid.readthedocs.io/en/latest',
-                         None),
-    'matplotlib': ('https://matplotlib.org/stable/', None),
-    'numpy': ('https://numpy.org/doc/stable/', None),
-    'pyesgf': ('https://esgf-pyclient.readthedocs.io/en/latest/', None),
-    'python': ('https://docs.python.org/3/', None),
-    'scipy': ('https://docs.scipy.org/doc/scipy/', None),
+    name: (url, (f'{INVENTORY_DIR}/{name}.inv', None))
+    for name, url in get_intersphinx_urls(rtd_version).items()
 }
 
 # -- Extlinks extension -------------------------------------------------------
@@ -483,7 +509,11 @@ extlinks = {
 
 # -- Custom Document processing ----------------------------------------------
 
-sys.path.append(os.path.dirname(__file__))
 from gensidebar import generate_sidebar
 
-generate_sidebar(globals(), "esmvalcore")
+# The sidebar is only written when its contents change, so the pages that
+# include it are not rebuilt needlessly. Set the environment variable
+# SPHINX_SKIP_SIDEBAR to skip generating it altogether once it exists.
+if (not os.environ.get("SPHINX_SKIP_SIDEBAR")
+        or not os.path.exists("_sidebar.rst.inc")):
+    generate_sidebar(globals(), "esmvalcore")
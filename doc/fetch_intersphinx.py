@@ -0,0 +1,54 @@
+"""Download the intersphinx inventories used by the documentation.
+
+The inventories are stored in the directory ``INVENTORY_DIR`` defined in
+``intersphinx_inventories.py``, where Sphinx will look for them before
+trying to download them. Run this script before building the
+documentation::
+
+    python doc/fetch_intersphinx.py
+
+Sphinx always prefers the local inventories when they are present, so they
+are not refreshed automatically. Rerun this script to update them.
+"""
+import os
+import sys
+import urllib.request
+from pathlib import Path
+
+from intersphinx_inventories import (
+    INVENTORY_DIR,
+    get_intersphinx_urls,
+    get_rtd_version,
+)
+
+
+def fetch_intersphinx():
+    """Download all inventories.
+
+    Returns
+    -------
+    bool
+        ``True`` if all inventories were downloaded successfully.
+    """
+    rtd_version = get_rtd_version(
+        os.environ.get("READTHEDOCS_VERSION", "latest"))
+    inventory_dir = Path(__file__).absolute().parent / INVENTORY_DIR
+    inventory_dir.mkdir(exist_ok=True)
+    success = True
+    for name, url in get_intersphinx_urls(rtd_version).items():
+        source = url.rstrip('/') + '/objects.inv'
+        target = inventory_dir / f'{name}.inv'
+        print(f"Downloading {source} to {target}")
+        try:
+            urllib.request.urlretrieve(source, target)
+        except OSError as exc:
+            # Do not leave a missing or truncated inventory behind, Sphinx
+            # would try it before the remote one.
+            target.unlink(missing_ok=True)
+            print(f"Failed to download {source}: {exc}")
+            success = False
+    return success
+
+
+if __name__ == '__main__':
+    sys.exit(0 if fetch_intersphinx() else 1)
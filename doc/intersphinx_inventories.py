@@ -0,0 +1,37 @@
+"""Intersphinx inventories used by the documentation.
+
+This module is shared by ``conf.py`` and ``fetch_intersphinx.py`` and must
+not import anything that is not part of the standard library.
+"""
+
+# Directory (relative to the documentation source directory) where the
+# inventories downloaded by ``fetch_intersphinx.py`` are stored.
+INVENTORY_DIR = '_intersphinx'
+
+
+def get_rtd_version(rtd_version):
+    """Get the ESMValTool documentation version to link to."""
+    if rtd_version not in ["latest", "stable", "doc"]:
+        rtd_version = "latest"
+    return rtd_version
+
+
+def get_intersphinx_urls(rtd_version):
+    """Get the documentation URL of every project linked with intersphinx."""
+    return {
+        'cf_units': 'https://cf-units.readthedocs.io/en/latest/',
+        'cftime': 'https://unidata.github.io/cftime/',
+        'esmvalcore':
+        f'https://docs.esmvaltool.org/projects/ESMValCore/en/{rtd_version}/',
+        'esmvaltool': f'https://docs.esmvaltool.org/en/{rtd_version}/',
+        'dask': 'https://docs.dask.org/en/stable/',
+        'distributed': 'https://distributed.dask.org/en/stable/',
+        'iris': 'https://scitools-iris.readthedocs.io/en/latest/',
+        'iris-esmf-regrid':
+        'https://iris-esmf-regrid.readthedocs.io/en/latest',
+        'matplotlib': 'https://matplotlib.org/stable/',
+        'numpy': 'https://numpy.org/doc/stable/',
+        'pyesgf': 'https://esgf-pyclient.readthedocs.io/en/latest/',
+        'python': 'https://docs.python.org/3/',
+        'scipy': 'https://docs.scipy.org/doc/scipy/',
+    }
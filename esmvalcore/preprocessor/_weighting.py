@@ -3,33 +3,38 @@
 import logging
 
 import iris
+import numpy as np
 
 from ._supplementary_vars import register_supplementaries
 
 logger = logging.getLogger(__name__)
 
 
-def _get_land_fraction(cube):
-    """Extract land fraction as :mod:`dask.array`."""
-    fx_cube = None
-    land_fraction = None
-    errors = []
+def _get_land_fraction(cube, dtype=None):
+    """Extract land or sea fraction as :mod:`dask.array`.
+
+    The fraction is returned as stored in the ancillary variable, together
+    with a flag that indicates whether it is the land fraction (``True``) or
+    the sea fraction (``False``). This avoids inverting a sea fraction that
+    is inverted again when weighting with the sea fraction. If ``dtype`` is
+    given, the fraction is converted to this data type.
+    """
     try:
         fx_cube = cube.ancillary_variable('land_area_fraction')
     except iris.exceptions.AncillaryVariableNotFoundError:
         try:
             fx_cube = cube.ancillary_variable('sea_area_fraction')
         except iris.exceptions.AncillaryVariableNotFoundError:
-            errors.append('Ancillary variables land/sea area fraction not '
-                          'found in cube. Check ancillary data availability.')
-            return (land_fraction, errors)
-
-    if fx_cube.var_name == 'sftlf':
-        land_fraction = fx_cube.core_data() / 100.0
-    if fx_cube.var_name == 'sftof':
-        land_fraction = 1.0 - fx_cube.core_data() / 100.0
+            errors = ['Ancillary variables land/sea area fraction not '
+                      'found in cube. Check ancillary data availability.']
+            return (None, True, errors)
 
-    return (land_fraction, errors)
+    if fx_cube.var_name not in ('sftlf', 'sftof'):
+        return (None, True, [])
+    fraction = fx_cube.core_data() / 100.0
+    if dtype is not None:
+        fraction = fraction.astype(dtype, copy=False)
+    return (fraction, fx_cube.var_name == 'sftlf', [])
 
 
 @register_supplementaries(
@@ -72,14 +77,19 @@ def weighting_landsea_fraction(cube, area_type):
     if area_type not in ('land', 'sea'):
         raise TypeError(
             f"Expected 'land' or 'sea' for area_type, got '{area_type}'")
-    (land_fraction, errors) = _get_land_fraction(cube)
-    if land_fraction is None:
+    # Use the data type of floating point data for the weights to avoid
+    # upcasting e.g. float32 data to float64 when multiplying
+    dtype = cube.dtype if np.issubdtype(cube.dtype, np.floating) else None
+    (fraction, is_land, errors) = _get_land_fraction(cube, dtype=dtype)
+    if fraction is None:
         raise ValueError(
             f"Weighting of '{cube.var_name}' with '{area_type}' fraction "
             f"failed because of the following errors: {' '.join(errors)}")
-    core_data = cube.core_data()
-    if area_type == 'land':
-        cube.data = core_data * land_fraction
-    elif area_type == 'sea':
-        cube.data = core_data * (1.0 - land_fraction)
+    if is_land == (area_type == 'land'):
+        weight = fraction
+    else:
+        weight = 1.0 - fraction
+    # Assigning a lazy array keeps the data lazy, so the multiplication
+    # becomes part of the Dask graph of the following preprocessor steps
+    cube.data = cube.core_data() * weight
     return cube
@@ -82,10 +82,10 @@ REQUIREMENTS = {
     ],
     # Documentation dependencies
     'doc': [
-        'autodocsumm>=0.2.2',
         'ipython',
         'nbsphinx',
         'sphinx>=6.1.3',
+        'sphinx-autoapi',
         'pydata_sphinx_theme',
     ],
     # Development dependencies
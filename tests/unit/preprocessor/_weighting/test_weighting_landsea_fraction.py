@@ -1,5 +1,6 @@
 """Unit tests for :mod:`esmvalcore.preprocessor._weighting`."""
 
+import dask.array as da
 import iris
 import iris.fileformats
 import numpy as np
@@ -53,28 +54,29 @@ CUBE_ANCILLARY_4 = CUBE_4.copy()
 CUBE_ANCILLARY_4.add_ancillary_variable(CUBE_SFTOF, (0))
 
 FRAC_SFTLF = np.array([0.1, 0.0, 1.0])
-FRAC_SFTOF = np.array([0.0, 1.0, 0.5, 0.3])
+FRAC_SFTOF = np.array([1.0, 0.0, 0.5, 0.7])
 
 LAND_FRACTION = [
-    (CUBE_3, None, [
+    (CUBE_3, None, True, [
         'Ancillary variables land/sea area fraction not found in cube. '
         'Check ancillary data availability.']),
-    (CUBE_4, None, [
+    (CUBE_4, None, True, [
         'Ancillary variables land/sea area fraction not found in cube. '
         'Check ancillary data availability.']),
-    (CUBE_ANCILLARY_3, FRAC_SFTLF, []),
-    (CUBE_ANCILLARY_4, FRAC_SFTOF, [])
+    (CUBE_ANCILLARY_3, FRAC_SFTLF, True, []),
+    (CUBE_ANCILLARY_4, FRAC_SFTOF, False, [])
 ]
 
 
-@pytest.mark.parametrize('cube,out,err', LAND_FRACTION)
-def test_get_land_fraction(cube, out, err):
+@pytest.mark.parametrize('cube,out,is_land_out,err', LAND_FRACTION)
+def test_get_land_fraction(cube, out, is_land_out, err):
     """Test calculation of land fraction."""
-    (land_fraction, errors) = weighting._get_land_fraction(cube)
-    if land_fraction is None:
-        assert land_fraction == out
+    (fraction, is_land, errors) = weighting._get_land_fraction(cube)
+    if fraction is None:
+        assert fraction == out
     else:
-        assert np.allclose(land_fraction, out)
+        assert np.allclose(fraction, out)
+    assert is_land is is_land_out
     assert len(errors) == len(err)
     for (idx, error) in enumerate(errors):
         assert err[idx] in error
@@ -114,3 +116,66 @@ def test_weighting_landsea_fraction(cube,
     weighted_cube = weighting.weighting_landsea_fraction(cube, area_type)
     assert np.array_equal(weighted_cube.data, cube.data)
     assert weighted_cube is cube
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+@pytest.mark.parametrize('area_type,out', [('land', CUBE_3_L),
+                                           ('sea', CUBE_3_O)])
+def test_weighting_landsea_fraction_keeps_dtype(area_type, out, lazy):
+    """Test that float32 data is not upcast by float64 fractions."""
+    data = np.array([10.0, 20.0, 0.0], dtype=np.float32)
+    if lazy:
+        data = da.from_array(data)
+    cube = CUBE_3.copy(data)
+    cube.add_ancillary_variable(CUBE_SFTLF, (0))
+    assert cube.ancillary_variable('land_area_fraction').dtype == np.float64
+
+    weighted_cube = weighting.weighting_landsea_fraction(cube, area_type)
+
+    assert weighted_cube.has_lazy_data() is lazy
+    assert weighted_cube.dtype == np.float32
+    result = weighted_cube.data
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, out.data.astype(np.float32),
+                               rtol=1e-6)
+
+
+def test_weighting_landsea_fraction_input_array_unchanged():
+    """Test that the array passed to the cube is not modified."""
+    data = np.array([1.0, 2.0, -1.0, 2.0])
+    cube = CUBE_4.copy(data)
+    cube.add_ancillary_variable(CUBE_SFTOF, (0))
+
+    weighted_cube = weighting.weighting_landsea_fraction(cube, 'land')
+
+    np.testing.assert_allclose(weighted_cube.data, CUBE_4_L.data)
+    np.testing.assert_array_equal(data, [1.0, 2.0, -1.0, 2.0])
+
+
+def test_weighting_landsea_fraction_lazy():
+    """Test that lazy data stays lazy."""
+    cube = CUBE_4.copy(CUBE_4.lazy_data())
+    cube.add_ancillary_variable(CUBE_SFTOF, (0))
+
+    weighted_cube = weighting.weighting_landsea_fraction(cube, 'land')
+
+    assert weighted_cube.has_lazy_data()
+    np.testing.assert_allclose(weighted_cube.data, CUBE_4_L.data)
+
+
+def test_weighting_landsea_fraction_masked_fraction():
+    """Test that a masked fraction keeps its mask on unmasked data."""
+    data = np.array([1.0, 2.0, -1.0, 2.0])
+    cube = CUBE_4.copy(data)
+    sftof = CUBE_SFTOF.copy(
+        np.ma.masked_array([100.0, 1e20, 50.0, 70.0],
+                           mask=[False, True, False, False]))
+    cube.add_ancillary_variable(sftof, (0))
+
+    weighted_cube = weighting.weighting_landsea_fraction(cube, 'sea')
+
+    result = weighted_cube.data
+    assert np.ma.isMaskedArray(result)
+    np.testing.assert_array_equal(result.mask, [False, True, False, False])
+    np.testing.assert_allclose(result.compressed(), [1.0, -0.5, 1.4])
+    np.testing.assert_array_equal(data, [1.0, 2.0, -1.0, 2.0])